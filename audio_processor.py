@@ -1,107 +1,406 @@
 import requests
 import os
+import json
+import asyncio
+import hashlib
+import mmap
+import functools
 import time
-from typing import Union, List, Dict, Any, Optional
+import types
+import random
+import warnings
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Union, List, Dict, Any, Optional, BinaryIO, Callable
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_retry_after(status_code: int, headers: Any) -> Optional[float]:
+    """Seconds to wait from a 429/503 response's Retry-After header, or None if absent"""
+    if status_code not in (429, 503):
+        return None
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after(func):
+    """Retry a request once, after the server's Retry-After delay, when it is rate limited"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except requests.exceptions.HTTPError as e:
+            if e.response is None:
+                raise
+            delay = _parse_retry_after(e.response.status_code, e.response.headers)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class _ApiRetry(Retry):
+    """
+    Retry policy that only repeats a POST when the server rejected it before doing any work
+    (429/503 with Retry-After), so a failed submission can't create duplicate edit jobs
+    """
+    
+    def _is_method_retryable(self, method: str) -> bool:
+        # Also stops read errors on a POST from being retried
+        return method.upper() != 'POST' and super()._is_method_retryable(method)
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == 'POST':
+            return bool(self.total and has_retry_after and status_code in (429, 503))
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class CleanvoiceAPIError(Exception):
+    """Raised when a Cleanvoice API request fails; status_code is None for network errors"""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class CacheLayer:
+    """
+    CacheLayer - On-disk cache for edit submissions and status responses
+    Modes: 'readWrite' reads and stores entries, 'readOnly' only reads, 'off' disables caching
+    """
+    
+    MODES = ('readWrite', 'readOnly', 'off')
+    RESULT_TTL = 7 * 24 * 60 * 60  # Finished results: 1 week
+    
+    def __init__(self, cache_dir: str, mode: str = 'readWrite'):
+        if mode not in self.MODES:
+            raise ValueError(f'Invalid cache mode. Must be one of: {", ".join(self.MODES)}')
+        if mode != 'off' and diskcache is None:
+            raise ImportError('diskcache is required for caching: pip install diskcache')
+        
+        self.mode = mode
+        self.cache = diskcache.Cache(cache_dir) if mode != 'off' else None
+    
+    @staticmethod
+    def make_key(url: str, payload: Any) -> str:
+        """Build a stable SHA256 key for a request"""
+        raw = _dumps({'url': url, 'payload': payload}, sort_keys=True)
+        return hashlib.sha256(raw).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+    
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        if self.mode == 'readWrite':
+            self.cache.set(key, value, expire=ttl)
+    
+    def delete(self, key: str) -> None:
+        if self.mode == 'readWrite':
+            self.cache.delete(key)
+    
+    def close(self) -> None:
+        if self.cache is not None:
+            self.cache.close()
+
+
+_VALID_FORMATS = frozenset({"auto", "mp3", "wav", "flac", "m4a"})
+_VALID_FORMATS_STR = ", ".join(sorted(_VALID_FORMATS))
+
+# Recommended settings used by enhance_audio_comprehensive; read-only so callers can't mutate them
+_COMPREHENSIVE_DEFAULTS = types.MappingProxyType({
+    # Core audio cleaning
+    'long_silences': True,
+    'stutters': True,
+    'fillers': True,
+    'mouth_sounds': True,
+    'hesitations': True,
+    'remove_noise': True,
+    'breath': True,
+    
+    # Audio enhancement
+    'normalize': True,
+    'target_lufs': -16,
+    'sound_studio': True,
+    
+    # Export settings
+    'export_format': "mp3",
+    
+    # Optional features
+    'transcription': False,
+    'summarize': False,
+    'social_content': False,
+    'export_timestamps': False,
+})
+
+# Single-feature wrappers generated onto AudioProcessor: method name -> (config flags, docstring)
+_FEATURE_FLAGS = {
+    'remove_silences': ({'long_silences': True}, 'Detect and remove long silences in audio'),
+    'remove_stutters': ({'stutters': True}, 'Identify and remove stutters from speech'),
+    'remove_fillers': ({'fillers': True}, "Remove filler words like 'um' or 'uh'"),
+    'remove_mouth_sounds': ({'mouth_sounds': True}, 'Eliminate unwanted mouth sounds'),
+    'remove_hesitations': ({'hesitations': True}, 'Remove hesitation noises in speech'),
+    'preserve_music': ({'keep_music': True}, 'Avoid removing music segments during edits'),
+    'apply_autoeq': ({'autoeq': True}, 'Apply automatic EQ adjustments (legacy option)'),
+    'enhance_with_ai': ({'sound_studio': True}, 'Use AI-based sound enhancement for better quality'),
+    'transcribe_audio': ({'transcription': True}, 'Convert speech in audio to text'),
+    'summarize_audio': ({'transcription': True, 'summarize': True}, 'Generate a summary of transcribed audio content'),
+    'create_social_content': (
+        {'transcription': True, 'summarize': True, 'social_content': True},
+        'Prepare audio clips for social media sharing'
+    ),
+}
+
+
+def _with_feature_methods(cls):
+    """Class decorator that adds one public wrapper per _FEATURE_FLAGS entry"""
+    def make_method(name: str, doc: str):
+        def method(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
+            return self._feature(name, files, additional_config)
+        method.__name__ = name
+        method.__qualname__ = f'{cls.__qualname__}.{name}'
+        method.__doc__ = doc
+        return method
+    
+    for name, (_, doc) in _FEATURE_FLAGS.items():
+        setattr(cls, name, make_method(name, doc))
+    return cls
+
+
+@_with_feature_methods
 class AudioProcessor:
     """
     AudioProcessor - A comprehensive audio processing class using Cleanvoice API
     Provides all the functions for audio enhancement and processing
     """
     
-    def __init__(self, api_key: str):
+    # Upper bound, in seconds, for the backoff between status polls
+    MAX_POLL_INTERVAL = 10
+    
+    # Files above MULTIPART_THRESHOLD bytes are uploaded in parallel parts when the API supports it
+    MULTIPART_THRESHOLD = 64 * 1024 * 1024
+    MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+    UPLOAD_WORKERS = 8
+    
+    # Rate-limited (429/503 with Retry-After) async requests are retried this many times
+    ASYNC_RETRIES = 5
+    
+    def __init__(self, api_key: str, cache: str = 'off', cache_dir: str = '.cleanvoice_cache'):
         self.api_key = api_key
         self.base_url = 'https://api.cleanvoice.ai/v2'
         self.headers = {
             'X-API-Key': api_key,
             'Content-Type': 'application/json'
         }
+        
+        # Shared session so keep-alive connections (and their TLS handshakes)
+        # are reused across uploads, submissions and status polls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=_ApiRetry(
+                total=5,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+                # Hand back the last error response so its message and status reach the caller
+                raise_on_status=False
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        self.cache = CacheLayer(cache_dir, cache)
+        # Submission cache keys of jobs still in flight, keyed by edit ID
+        self._pending_keys = {}
+        # SHA256 of each file uploaded while caching is on, keyed by its signed URL
+        self._upload_digests = {}
+        
+        # aiohttp session for the async API and the event loop it belongs to, created on first use
+        self._async_session = None
+        self._async_loop = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the underlying HTTP session, its pooled connections and the cache"""
+        self.session.close()
+        self.cache.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the async HTTP session along with the sync resources"""
+        if self._async_session is not None and not self._async_session.closed:
+            if self._async_loop is asyncio.get_running_loop():
+                await self._async_session.close()
+            else:
+                # Created on another loop; it can't be awaited from here
+                self._async_session.detach()
+        self._async_session = None
+        self._async_loop = None
+        self.close()
     
-    def process_audio(self, files: Union[str, List[str]], config: Dict[str, Any] = None) -> Dict[str, Any]:
+    def process_audio(self, files: Union[str, List[str]], config: Dict[str, Any] = None, webhook_url: Optional[str] = None) -> Dict[str, Any]:
         """
         Process audio files with customizable editing options
         
         Args:
             files: Single file URL or list of file URLs
             config: Configuration options for processing
+            webhook_url: Optional URL the API should POST to when the job finishes
             
         Returns:
             Edit job response with task ID
         """
         try:
-            if config is None:
-                config = {}
-                
-            file_array = files if isinstance(files, list) else [files]
+            payload = self._build_payload(files, config, webhook_url)
             
-            payload = {
-                'input': {
-                    'files': file_array,
-                    'config': config
-                }
-            }
+            url = f'{self.base_url}/edits'
+            cache_key = self._submission_key(url, payload)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                # Same submission already finished; confirm the job still exists and
+                # refresh its status (and download URL) before reusing it
+                try:
+                    status = self._fetch_edit_status(cached['id'])
+                except CleanvoiceAPIError as e:
+                    if e.status_code is None or e.status_code >= 500:
+                        raise
+                    status = None
+                if self._reuse_submission(cache_key, cached['id'], status):
+                    return {'id': cached['id']}
             
-            response = requests.post(
-                f'{self.base_url}/edits',
-                json=payload,
+            response = self.session.post(
+                url,
+                data=_dumps(payload),
                 headers=self.headers
             )
             response.raise_for_status()
             
-            return response.json()
+            job = self._parse_json(response.content, response.status_code, 'process audio')
+            self._pending_keys[job['id']] = cache_key
+            return job
         except requests.exceptions.RequestException as e:
-            error_msg = e.response.json().get('message', str(e)) if e.response else str(e)
-            raise Exception(f'Failed to process audio: {error_msg}')
+            self._raise_api_error(e, 'process audio')
     
-    def remove_silences(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Detect and remove long silences in audio"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'long_silences': True,
-            **additional_config
-        }
-        return self.process_audio(files, config)
+    def _submission_key(self, url: str, payload: Dict[str, Any]) -> str:
+        """
+        Cache key for an edit submission
+        
+        Files uploaded through this processor are keyed by their content hash instead
+        of their signed URL, which is different on every upload.
+        """
+        files = [self._upload_digests.get(f, f) for f in payload['input']['files']]
+        return self.cache.make_key(url, {**payload, 'input': {**payload['input'], 'files': files}})
     
-    def remove_stutters(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Identify and remove stutters from speech"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'stutters': True,
-            **additional_config
-        }
-        return self.process_audio(files, config)
+    def _reuse_submission(self, cache_key: str, edit_id: str, status: Optional[Dict[str, Any]]) -> bool:
+        """Keep a cached submission if its job still succeeded, otherwise evict it"""
+        if status is not None and status['status'] == 'SUCCESS':
+            self._pending_keys[edit_id] = cache_key
+            self._store_result(edit_id, status)
+            return True
+        self._evict_edit(edit_id)
+        self.cache.delete(cache_key)
+        return False
     
-    def remove_fillers(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Remove filler words like 'um' or 'uh'"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'fillers': True,
-            **additional_config
+    @staticmethod
+    def _build_payload(files: Union[str, List[str]], config: Dict[str, Any] = None, webhook_url: Optional[str] = None) -> Dict[str, Any]:
+        """Build the request body for an edit submission"""
+        if config is None:
+            config = {}
+            
+        file_array = files if isinstance(files, list) else [files]
+        
+        payload = {
+            'input': {
+                'files': file_array,
+                'config': config
+            }
         }
-        return self.process_audio(files, config)
+        if webhook_url:
+            payload['input']['webhook'] = webhook_url
+        return payload
     
-    def remove_mouth_sounds(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Eliminate unwanted mouth sounds"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'mouth_sounds': True,
-            **additional_config
-        }
-        return self.process_audio(files, config)
+    @staticmethod
+    def _raise_api_error(exc: requests.exceptions.RequestException, action: str):
+        """Re-raise a requests error as CleanvoiceAPIError with the API's message when available"""
+        response = exc.response
+        if response is None:
+            raise CleanvoiceAPIError(f'Failed to {action}: {exc}') from exc
+        
+        try:
+            error_msg = response.json().get('message') or str(exc)
+        except (ValueError, AttributeError):
+            error_msg = response.text[:200] or str(exc)
+        raise CleanvoiceAPIError(f'Failed to {action}: {error_msg}', response.status_code) from exc
     
-    def remove_hesitations(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Remove hesitation noises in speech"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'hesitations': True,
-            **additional_config
-        }
+    @staticmethod
+    def _parse_json(data: bytes, status_code: int, action: str) -> Any:
+        """Parse a successful response body, raising CleanvoiceAPIError if it isn't valid JSON"""
+        try:
+            return _loads(data)
+        except ValueError as e:
+            raise CleanvoiceAPIError(f'Failed to {action}: invalid JSON response ({e})', status_code) from e
+    
+    def _feature(self, name: str, files: Union[str, List[str]], extra: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Process files with the config flags registered for a single-feature wrapper"""
+        flags = _FEATURE_FLAGS[name][0]
+        config = {**flags, **extra} if extra else dict(flags)
         return self.process_audio(files, config)
     
     def mute_segments(self, files: Union[str, List[str]], mute_lufs: int = -80, additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -126,16 +425,6 @@ class AudioProcessor:
         }
         return self.process_audio(files, config)
     
-    def preserve_music(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Avoid removing music segments during edits"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'keep_music': True,
-            **additional_config
-        }
-        return self.process_audio(files, config)
-    
     def reduce_breath_sounds(self, files: Union[str, List[str]], mute_lufs: int = -80, additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Lower the volume of breath sounds naturally"""
         if additional_config is None:
@@ -158,26 +447,6 @@ class AudioProcessor:
         }
         return self.process_audio(files, config)
     
-    def apply_autoeq(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Apply automatic EQ adjustments (legacy option)"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'autoeq': True,
-            **additional_config
-        }
-        return self.process_audio(files, config)
-    
-    def enhance_with_ai(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Use AI-based sound enhancement for better quality"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'sound_studio': True,
-            **additional_config
-        }
-        return self.process_audio(files, config)
-    
     def set_mute_lufs(self, files: Union[str, List[str]], mute_lufs: int, additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Define loudness threshold for muting audio segments"""
         if mute_lufs > 0:
@@ -206,9 +475,8 @@ class AudioProcessor:
     
     def export_audio(self, files: Union[str, List[str]], format: str = "auto", additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Export processed audio in desired format"""
-        valid_formats = ["auto", "mp3", "wav", "flac", "m4a"]
-        if format not in valid_formats:
-            raise ValueError(f'Invalid export format. Must be one of: {", ".join(valid_formats)}')
+        if format not in _VALID_FORMATS:
+            raise ValueError(f'Invalid export format. Must be one of: {_VALID_FORMATS_STR}')
         
         if additional_config is None:
             additional_config = {}
@@ -218,39 +486,6 @@ class AudioProcessor:
         }
         return self.process_audio(files, config)
     
-    def transcribe_audio(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Convert speech in audio to text"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'transcription': True,
-            **additional_config
-        }
-        return self.process_audio(files, config)
-    
-    def summarize_audio(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Generate a summary of transcribed audio content"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'transcription': True,
-            'summarize': True,
-            **additional_config
-        }
-        return self.process_audio(files, config)
-    
-    def create_social_content(self, files: Union[str, List[str]], additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Prepare audio clips for social media sharing"""
-        if additional_config is None:
-            additional_config = {}
-        config = {
-            'transcription': True,
-            'summarize': True,
-            'social_content': True,
-            **additional_config
-        }
-        return self.process_audio(files, config)
-    
     def merge_tracks(self, files: List[str], normalize: bool = True, additional_config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Merge multiple audio tracks into a single file"""
         if not isinstance(files, list) or len(files) < 2:
@@ -277,59 +512,177 @@ class AudioProcessor:
             Signed URL for the uploaded file
         """
         try:
-            # Step 1: Get signed URL
-            upload_response = requests.post(
-                f'{self.base_url}/upload?filename={filename}',
-                headers={'X-API-Key': self.api_key}
-            )
-            upload_response.raise_for_status()
+            file_size = os.path.getsize(file_path)
             
-            signed_url = upload_response.json()['signedUrl']
+            # Step 1: Get signed URL, asking for part URLs when the file is large
+            params = {'filename': filename}
+            if file_size > self.MULTIPART_THRESHOLD:
+                params['multipart'] = 'true'
+                params['parts'] = -(-file_size // self.MULTIPART_CHUNK_SIZE)
             
-            # Step 2: Upload file to signed URL
-            with open(file_path, 'rb') as file:
-                file_data = file.read()
-            
-            upload_put_response = requests.put(
-                signed_url,
-                data=file_data,
-                headers={'Content-Type': 'application/octet-stream'}
-            )
-            upload_put_response.raise_for_status()
+            with ThreadPoolExecutor(max_workers=1) as executor, open(file_path, 'rb') as file:
+                url_future = executor.submit(
+                    self.session.post,
+                    f'{self.base_url}/upload',
+                    params=params,
+                    headers={'X-API-Key': self.api_key}
+                )
+                
+                # While the signed URL request is in flight, start kernel readahead of the file
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                # and hash it for the submission cache key
+                digest = self._file_digest(file) if self.cache.mode != 'off' else None
+                
+                upload_response = url_future.result()
+                upload_response.raise_for_status()
+                
+                upload_info = upload_response.json()
+                signed_url = upload_info['signedUrl']
+                if digest is not None:
+                    self._upload_digests[signed_url] = digest
+                
+                # Step 2a: Parallel part upload when the server handed out part URLs
+                if 'partUrls' in upload_info and 'completeUrl' in upload_info:
+                    self._upload_parts(file, upload_info['partUrls'], upload_info['completeUrl'])
+                    return signed_url
+                
+                # Step 2b: Stream file to signed URL without loading it into memory
+                self._put_stream(signed_url, file, file_size)
             
             return signed_url
         except requests.exceptions.RequestException as e:
-            error_msg = e.response.json().get('message', str(e)) if e.response else str(e)
-            raise Exception(f'Failed to upload file: {error_msg}')
+            self._raise_api_error(e, 'upload file')
+    
+    @classmethod
+    def _file_digest(cls, file: BinaryIO) -> str:
+        """SHA256 of an open file's contents; leaves the file positioned at the start"""
+        digest = hashlib.sha256()
+        for block in iter(functools.partial(file.read, cls.MULTIPART_CHUNK_SIZE), b''):
+            digest.update(block)
+        file.seek(0)
+        return 'sha256:' + digest.hexdigest()
+    
+    @_retry_after
+    def _put_stream(self, signed_url: str, file: BinaryIO, file_size: int) -> requests.Response:
+        """PUT an open file to a signed URL, streaming it from the start"""
+        file.seek(0)
+        response = self.session.put(
+            signed_url,
+            data=file,
+            headers={
+                'Content-Type': 'application/octet-stream',
+                'Content-Length': str(file_size)
+            }
+        )
+        response.raise_for_status()
+        return response
+    
+    def _upload_parts(self, file: BinaryIO, part_urls: List[str], complete_url: str) -> None:
+        """Upload MULTIPART_CHUNK_SIZE slices of a file to presigned part URLs in parallel"""
+        file_size = os.fstat(file.fileno()).st_size
+        expected_parts = -(-file_size // self.MULTIPART_CHUNK_SIZE)
+        if len(part_urls) != expected_parts:
+            raise CleanvoiceAPIError(
+                f'Failed to upload file: expected {expected_parts} part URLs, got {len(part_urls)}'
+            )
+        
+        def put_part(part_number: int) -> Dict[str, Any]:
+            start = (part_number - 1) * self.MULTIPART_CHUNK_SIZE
+            # Slicing the memoryview sends straight from the mapping without copying the part
+            with view[start:start + self.MULTIPART_CHUNK_SIZE] as chunk:
+                response = self.session.put(
+                    part_urls[part_number - 1],
+                    data=chunk,
+                    headers={'Content-Type': 'application/octet-stream'}
+                )
+            response.raise_for_status()
+            return {'PartNumber': part_number, 'ETag': response.headers.get('ETag')}
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            with ThreadPoolExecutor(max_workers=self.UPLOAD_WORKERS) as executor:
+                parts = list(executor.map(put_part, range(1, expected_parts + 1)))
+        
+        complete_response = self.session.post(
+            complete_url,
+            json={'parts': parts},
+            headers={'Content-Type': 'application/json'}
+        )
+        complete_response.raise_for_status()
     
     def get_edit_status(self, edit_id: str) -> Dict[str, Any]:
         """Check the status of an edit job"""
+        cached = self.cache.get(f'status:{edit_id}')
+        if cached is not None:
+            return cached
+        
+        status = self._fetch_edit_status(edit_id)
+        
+        # Only final results are cached; in-flight statuses would go stale between polls
+        if status['status'] == 'SUCCESS':
+            self._store_result(edit_id, status)
+        return status
+    
+    def _fetch_edit_status(self, edit_id: str) -> Dict[str, Any]:
+        """Request an edit job's status from the API, bypassing the cache"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/edits/{edit_id}',
                 headers={'X-API-Key': self.api_key}
             )
             response.raise_for_status()
-            return response.json()
+            return self._parse_json(response.content, response.status_code, 'get edit status')
         except requests.exceptions.RequestException as e:
-            error_msg = e.response.json().get('message', str(e)) if e.response else str(e)
-            raise Exception(f'Failed to get edit status: {error_msg}')
+            self._raise_api_error(e, 'get edit status')
+    
+    def _store_result(self, edit_id: str, status: Dict[str, Any]) -> None:
+        """Cache a finished job's status and link it to the submission that created it"""
+        self.cache.set(f'status:{edit_id}', status, CacheLayer.RESULT_TTL)
+        cache_key = self._pending_keys.pop(edit_id, None)
+        if cache_key is not None:
+            self.cache.set(cache_key, {'id': edit_id}, CacheLayer.RESULT_TTL)
+            # Remember the submission key so delete_edit can evict it too
+            self.cache.set(f'submission:{edit_id}', cache_key, CacheLayer.RESULT_TTL)
+    
+    def _evict_edit(self, edit_id: str) -> None:
+        """Drop every cache entry that refers to an edit job"""
+        cache_key = self.cache.get(f'submission:{edit_id}')
+        if cache_key is not None:
+            self.cache.delete(cache_key)
+        self.cache.delete(f'submission:{edit_id}')
+        self.cache.delete(f'status:{edit_id}')
     
-    def wait_for_completion(self, edit_id: str, poll_interval: int = 5000, max_wait_time: int = 300000) -> Dict[str, Any]:
+    def wait_for_completion(self, edit_id: str, poll_interval: float = 0.5, max_wait_time: int = 300000) -> Dict[str, Any]:
         """
         Wait for edit completion and return results
         
+        Polls with exponential backoff and jitter, starting at poll_interval
+        and growing by 1.5x per attempt up to MAX_POLL_INTERVAL seconds.
+        
         Args:
             edit_id: Edit job ID
-            poll_interval: Polling interval in milliseconds
+            poll_interval: Initial polling interval in seconds, as a float.
+                Integers are still read as milliseconds, the old unit, and
+                emit a DeprecationWarning.
             max_wait_time: Maximum wait time in milliseconds (default: 5 minutes)
             
         Returns:
             Final edit results
         """
-        start_time = time.time() * 1000  # Convert to milliseconds
+        if isinstance(poll_interval, int) and not isinstance(poll_interval, bool):
+            # Older callers passed the interval as integer milliseconds
+            warnings.warn(
+                'poll_interval is now given in seconds as a float; '
+                f'reading {poll_interval} as milliseconds',
+                DeprecationWarning,
+                stacklevel=2
+            )
+            poll_interval = poll_interval / 1000
         
-        while (time.time() * 1000) - start_time < max_wait_time:
+        delay = poll_interval
+        deadline_ns = time.monotonic_ns() + max_wait_time * 1_000_000
+        
+        while time.monotonic_ns() < deadline_ns:
             status = self.get_edit_status(edit_id)
             
             if status['status'] == 'SUCCESS':
@@ -337,23 +690,280 @@ class AudioProcessor:
             elif status['status'] == 'FAILURE':
                 raise Exception('Edit job failed')
             
-            # Wait before next poll
-            time.sleep(poll_interval / 1000)  # Convert to seconds
+            # Back off before next poll
+            time.sleep(delay + random.uniform(0, delay * 0.2))
+            delay = min(delay * 1.5, self.MAX_POLL_INTERVAL)
+        
+        raise Exception('Edit job timed out')
+    
+    def wait_via_webhook(self, edit_id: str, port: Optional[int] = None, host: str = '127.0.0.1', max_wait_time: int = 300000) -> Dict[str, Any]:
+        """
+        Wait for edit completion by receiving the webhook callback
+        
+        Starts a small HTTP server on host:port and blocks until the API POSTs
+        to it. Pass the public URL of that server as webhook_url to process_audio.
+        Any POST is only a wake-up signal: the result is always fetched from
+        the API, so a forged POST cannot inject a result. Without a callback the
+        status is still checked every MAX_POLL_INTERVAL seconds, and with no port
+        it falls back to wait_for_completion.
+        
+        Args:
+            edit_id: Edit job ID
+            port: Local port the callback server listens on
+            host: Local interface to bind (default: loopback only)
+            max_wait_time: Maximum wait time in milliseconds (default: 5 minutes)
+            
+        Returns:
+            Final edit results
+        """
+        if port is None:
+            return self.wait_for_completion(edit_id, max_wait_time=max_wait_time)
+        
+        received = threading.Event()
+        
+        class WebhookHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                # The callback body format isn't relied on; drain it and wake the waiter
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                self.send_response(200)
+                self.end_headers()
+                received.set()
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer((host, port), WebhookHandler)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        
+        deadline_ns = time.monotonic_ns() + max_wait_time * 1_000_000
+        try:
+            # Check once up front: the job may have finished before the server was listening
+            while True:
+                received.clear()
+                status = self.get_edit_status(edit_id)
+                
+                if status['status'] == 'SUCCESS':
+                    return status
+                elif status['status'] == 'FAILURE':
+                    raise Exception('Edit job failed')
+                
+                remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+                if remaining <= 0:
+                    raise Exception('Edit job timed out')
+                # Wake on the callback, or re-check on a timer in case it never arrives
+                received.wait(min(remaining, self.MAX_POLL_INTERVAL))
+        finally:
+            server.shutdown()
+            server.server_close()
+    
+    def process_audio_batch(self, files_list: List[str], config: Dict[str, Any] = None, max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Process several files as independent edit jobs in parallel
+        
+        Args:
+            files_list: List of file URLs, one edit job per file
+            config: Configuration options applied to every job
+            max_workers: Maximum number of jobs submitted and polled at once
+            
+        Returns:
+            Final edit results, in the same order as files_list
+
+        Raises the first job error as soon as it happens; jobs that have not
+        started yet are cancelled and jobs already polling finish in the
+        background.
+        """
+        def run_job(file_url: str) -> Dict[str, Any]:
+            job = self.process_audio(file_url, config)
+            return self.wait_for_completion(job['id'])
+
+        results = [None] * len(files_list)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {executor.submit(run_job, f): i for i, f in enumerate(files_list)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except BaseException:
+            # Don't block on the remaining jobs once the batch has failed
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        return results
+    
+    async def _get_async_session(self):
+        """
+        Return the shared aiohttp session, creating it on first use
+        
+        A session only works on the event loop it was created on, so a new one is made
+        whenever the running loop changes (e.g. separate asyncio.run calls).
+        """
+        if aiohttp is None:
+            raise ImportError('aiohttp is required for the async API: pip install aiohttp')
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            if self._async_session is not None and not self._async_session.closed:
+                # The old session can't be awaited from this loop; release it without closing
+                self._async_session.detach()
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, keepalive_timeout=30)
+            )
+            self._async_loop = loop
+        return self._async_session
+    
+    async def _arequest(self, method: str, url: str, action: str, body_factory: Optional[Callable[[], Any]] = None, **kwargs) -> tuple:
+        """
+        Send an async request and return (status, body)
+        
+        Mirrors the sync retry policy for rate limits: a 429/503 with Retry-After is
+        retried after the given delay, up to ASYNC_RETRIES times. Other failures raise
+        CleanvoiceAPIError. Pass body_factory for bodies that can only be sent once
+        (aiohttp closes file bodies); it is called for a fresh body on every attempt.
+        """
+        session = await self._get_async_session()
+        try:
+            for attempt in range(self.ASYNC_RETRIES + 1):
+                if body_factory is not None:
+                    kwargs['data'] = body_factory()
+                async with session.request(method, url, **kwargs) as response:
+                    delay = _parse_retry_after(response.status, response.headers)
+                    if delay is None or attempt == self.ASYNC_RETRIES:
+                        await self._araise_for_status(response, action)
+                        return response.status, await response.read()
+                await asyncio.sleep(delay)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise CleanvoiceAPIError(f'Failed to {action}: {e}') from e
+    
+    @staticmethod
+    async def _araise_for_status(response, action: str) -> None:
+        """Raise with the API's error message if an async response failed"""
+        if response.status < 400:
+            return
+        try:
+            error_msg = (await response.json()).get('message', response.reason)
+        except (aiohttp.ContentTypeError, ValueError, AttributeError):
+            error_msg = (await response.text())[:200] or response.reason
+        raise CleanvoiceAPIError(f'Failed to {action}: {error_msg}', response.status)
+    
+    async def aprocess_audio(self, files: Union[str, List[str]], config: Dict[str, Any] = None, webhook_url: Optional[str] = None) -> Dict[str, Any]:
+        """Async version of process_audio"""
+        payload = self._build_payload(files, config, webhook_url)
+        url = f'{self.base_url}/edits'
+        cache_key = self._submission_key(url, payload)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            try:
+                status = await self._afetch_edit_status(cached['id'])
+            except CleanvoiceAPIError as e:
+                if e.status_code is None or e.status_code >= 500:
+                    raise
+                status = None
+            if self._reuse_submission(cache_key, cached['id'], status):
+                return {'id': cached['id']}
+        
+        status_code, body = await self._arequest('POST', url, 'process audio', data=_dumps(payload), headers=self.headers)
+        job = self._parse_json(body, status_code, 'process audio')
+        
+        self._pending_keys[job['id']] = cache_key
+        return job
+    
+    async def aupload_file(self, file_path: str, filename: str) -> str:
+        """Async version of upload_file"""
+        status_code, body = await self._arequest(
+            'POST',
+            f'{self.base_url}/upload',
+            'upload file',
+            params={'filename': filename},
+            headers={'X-API-Key': self.api_key}
+        )
+        signed_url = self._parse_json(body, status_code, 'upload file')['signedUrl']
+        if self.cache.mode != 'off':
+            with open(file_path, 'rb') as file:
+                self._upload_digests[signed_url] = await asyncio.to_thread(self._file_digest, file)
+        
+        await self._arequest(
+            'PUT',
+            signed_url,
+            'upload file',
+            body_factory=lambda: open(file_path, 'rb'),
+            headers={
+                'Content-Type': 'application/octet-stream',
+                'Content-Length': str(os.path.getsize(file_path))
+            }
+        )
+        
+        return signed_url
+    
+    async def aget_edit_status(self, edit_id: str) -> Dict[str, Any]:
+        """Async version of get_edit_status"""
+        cached = self.cache.get(f'status:{edit_id}')
+        if cached is not None:
+            return cached
+        
+        status = await self._afetch_edit_status(edit_id)
+        
+        # Only final results are cached; in-flight statuses would go stale between polls
+        if status['status'] == 'SUCCESS':
+            self._store_result(edit_id, status)
+        return status
+    
+    async def _afetch_edit_status(self, edit_id: str) -> Dict[str, Any]:
+        """Async version of _fetch_edit_status"""
+        status_code, body = await self._arequest(
+            'GET',
+            f'{self.base_url}/edits/{edit_id}',
+            'get edit status',
+            headers={'X-API-Key': self.api_key}
+        )
+        return self._parse_json(body, status_code, 'get edit status')
+    
+    async def await_for_completion(self, edit_id: str, poll_interval: float = 0.5, max_wait_time: int = 300000) -> Dict[str, Any]:
+        """Async version of wait_for_completion; sleeps without blocking the event loop"""
+        delay = poll_interval
+        deadline_ns = time.monotonic_ns() + max_wait_time * 1_000_000
+        
+        while time.monotonic_ns() < deadline_ns:
+            status = await self.aget_edit_status(edit_id)
+            
+            if status['status'] == 'SUCCESS':
+                return status
+            elif status['status'] == 'FAILURE':
+                raise Exception('Edit job failed')
+            
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.2))
+            delay = min(delay * 1.5, self.MAX_POLL_INTERVAL)
         
         raise Exception('Edit job timed out')
     
+    async def process_many(self, files_list: List[str], config: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Process several files as independent edit jobs on one event loop
+        
+        Args:
+            files_list: List of file URLs, one edit job per file
+            config: Configuration options applied to every job
+            
+        Returns:
+            Final edit results, in the same order as files_list
+        """
+        async def pipeline(file_url: str) -> Dict[str, Any]:
+            job = await self.aprocess_audio(file_url, config)
+            return await self.await_for_completion(job['id'])
+        
+        return list(await asyncio.gather(*[pipeline(f) for f in files_list]))
+    
     def delete_edit(self, edit_id: str) -> Dict[str, Any]:
         """Delete an edit job and its associated files"""
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f'{self.base_url}/edits/{edit_id}',
                 headers={'X-API-Key': self.api_key}
             )
             response.raise_for_status()
+            self._evict_edit(edit_id)
             return response.json()
         except requests.exceptions.RequestException as e:
-            error_msg = e.response.json().get('message', str(e)) if e.response else str(e)
-            raise Exception(f'Failed to delete edit: {error_msg}')
+            self._raise_api_error(e, 'delete edit')
     
     def enhance_audio_comprehensive(self, files: Union[str, List[str]], options: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -366,34 +976,4 @@ class AudioProcessor:
         Returns:
             Edit job response
         """
-        if options is None:
-            options = {}
-            
-        default_config = {
-            # Core audio cleaning
-            'long_silences': True,
-            'stutters': True,
-            'fillers': True,
-            'mouth_sounds': True,
-            'hesitations': True,
-            'remove_noise': True,
-            'breath': True,
-            
-            # Audio enhancement
-            'normalize': True,
-            'target_lufs': -16,
-            'sound_studio': True,
-            
-            # Export settings
-            'export_format': "mp3",
-            
-            # Optional features
-            'transcription': False,
-            'summarize': False,
-            'social_content': False,
-            'export_timestamps': False,
-            
-            **options
-        }
-        
-        return self.process_audio(files, default_config)
+        return self.process_audio(files, {**_COMPREHENSIVE_DEFAULTS, **(options or {})})
@@ -6,15 +6,32 @@ A comprehensive audio processing tool using Cleanvoice API
 
 import os
 import sys
-import glob
-import requests
+import asyncio
+import functools
+import inspect
+import shutil
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from audio_processor import AudioProcessor
 
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+# Supported audio extensions, in order of preference
+_AUDIO_EXTS = ('.mp3', '.wav', '.m4a', '.flac', '.aac')
+
+# (divisor, suffix) per power of 1024, used by format_file_size
+_SIZE_UNITS = ((1, 'B'), (1024, 'KB'), (1024 ** 2, 'MB'), (1024 ** 3, 'GB'), (1024 ** 4, 'TB'))
+
 
 class InteractiveAudioProcessor:
     """Interactive command-line audio processor with all functionality from the JavaScript version"""
     
+    # Read size for streaming downloads to disk
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    
     def __init__(self, api_key: str):
         self.processor = AudioProcessor(api_key)
         self.function_map = {
@@ -79,6 +96,15 @@ class InteractiveAudioProcessor:
                 'params': [{'export_format': 'auto', 'transcription': True}]
             }
         }
+        
+        # Bind each command's parameters once so dispatch is a lookup and a call
+        for config in self.function_map.values():
+            method = getattr(self.processor, config['func'])
+            param_names = list(inspect.signature(method).parameters)[1:]
+            config['bound'] = functools.partial(method, **dict(zip(param_names, config['params'])))
+        
+        # Filename stem suffixes of files this tool has written, e.g. "-rm-silence"
+        self.output_suffixes = tuple(f"-{command.replace(' ', '-')}" for command in self.function_map)
     
     def show_help(self):
         """Display the help menu with all available commands"""
@@ -108,6 +134,9 @@ class InteractiveAudioProcessor:
         print('🚀 All-in-One:')
         print('  comprehensive  - Apply all enhancements')
         print('')
+        print('📂 Batch:')
+        print('  all <command>  - Run a command on every audio file as one job (one combined output)')
+        print('')
         print('❓ Other commands:')
         print('  help           - Show this help')
         print('  quit           - Exit the program')
@@ -116,29 +145,54 @@ class InteractiveAudioProcessor:
         print('  Audio: MP3, WAV, M4A, FLAC, AAC')
         print('')
     
+    def find_audio_files(self) -> list[str]:
+        """Find all audio files in the current directory, ordered by preferred extension"""
+        matches = []
+        with os.scandir('.') as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                # Skip hidden files, which glob('*.ext') never matched
+                if name.startswith('.') or not name.endswith(_AUDIO_EXTS) or not entry.is_file():
+                    continue
+                matches.append((_AUDIO_EXTS.index(os.path.splitext(name)[1]), entry.name))
+        # Sort on the extension rank only, keeping directory order within each extension like glob did
+        matches.sort(key=lambda match: match[0])
+        return [name for _, name in matches]
+    
+    def is_generated_output(self, filename: str) -> bool:
+        """Check whether a file was written by an earlier command or batch run"""
+        stem = Path(filename).stem
+        return stem.startswith('batch-') or stem.endswith(self.output_suffixes)
+    
     def find_audio_file(self) -> tuple[str, str]:
         """Find the first audio file in the current directory"""
-        supported_extensions = ['.mp3', '.wav', '.m4a', '.flac', '.aac']
-        
-        for ext in supported_extensions:
-            pattern = f"*{ext}"
-            files = glob.glob(pattern, recursive=False)
-            if files:
-                file_path = files[0]
-                filename = os.path.basename(file_path)
-                return file_path, filename
+        files = self.find_audio_files()
+        if files:
+            return files[0], files[0]
         
         return None, None
     
     def download_file(self, url: str, output_path: str) -> bool:
         """Download a file from URL to local path"""
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
+            with self.processor.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                # Let urllib3 undo any gzip/deflate transfer encoding on the raw stream
+                response.raw.decode_content = True
+                
+                source = response.raw
+                if tqdm is not None:
+                    # Content-Length counts encoded bytes, but read() returns decoded ones
+                    length = response.headers.get('Content-Length')
+                    encoded = response.headers.get('Content-Encoding', 'identity') != 'identity'
+                    source = tqdm.wrapattr(
+                        response.raw, 'read',
+                        total=int(length) if length and not encoded else None,
+                        desc='Downloading'
+                    )
+                
+                with source as stream, open(output_path, 'wb') as file:
+                    shutil.copyfileobj(stream, file, length=self.DOWNLOAD_CHUNK_SIZE)
             
             return True
         except Exception as e:
@@ -147,14 +201,50 @@ class InteractiveAudioProcessor:
     
     def format_file_size(self, size_bytes: int) -> str:
         """Format file size in human readable format"""
-        if size_bytes < 1024:
+        # Every power of 1024 adds 10 bits, so the bit length picks the unit directly
+        idx = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        if not idx:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.2f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.2f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+        divisor, suffix = _SIZE_UNITS[idx]
+        return f"{size_bytes / divisor:.2f} {suffix}"
+    
+    def save_result(self, result: dict, output_path: str):
+        """Download a finished job's audio and print its statistics and transcription"""
+        download_url = result['result']['download_url']
+        
+        if self.download_file(download_url, output_path):
+            print('\n✅ Processing completed successfully!')
+            print(f'📁 File saved as: {output_path}')
+            
+            # Check file size
+            file_size = os.path.getsize(output_path)
+            print(f'📊 File size: {self.format_file_size(file_size)}')
+            
+            if file_size > 0:
+                print('🎉 The audio file is ready to play!')
+            else:
+                print('⚠️ Warning: Downloaded file is empty')
+            
+            # Show statistics
+            if 'statistics' in result['result']:
+                stats = result['result']['statistics']
+                print('\n📊 Processing Statistics:')
+                print(f'   Dead air removed: {stats.get("DEADAIR", 0)}')
+                print(f'   Breaths removed: {stats.get("BREATH", 0)}')
+                print(f'   Stutters removed: {stats.get("STUTTERING", 0)}')
+                print(f'   Mouth sounds removed: {stats.get("MOUTH_SOUND", 0)}')
+                print(f'   Filler sounds removed: {stats.get("FILLER_SOUND", 0)}')
+            
+            # Show transcription if available
+            if 'transcription' in result['result'] and 'paragraphs' in result['result']['transcription']:
+                paragraphs = result['result']['transcription']['paragraphs']
+                print('\n📝 Transcription:')
+                for i, paragraph in enumerate(paragraphs[:3]):
+                    print(f'   {i + 1}. [{paragraph["start"]}s - {paragraph["end"]}s] {paragraph["text"]}')
+                if len(paragraphs) > 3:
+                    print(f'   ... and {len(paragraphs) - 3} more paragraphs')
+            
+            print('\n🎵 Ready for next command! Type "help" for options or "quit" to exit.')
     
     async def process_audio_file(self, command: str):
         """Process audio file with the given command"""
@@ -183,12 +273,8 @@ class InteractiveAudioProcessor:
             print('✅ File uploaded successfully!')
             
             # Process the audio
-            params = config['params'].copy()
             print(f'\n🔧 Processing audio with {config["name"]}...')
-            
-            # Call the appropriate method
-            method = getattr(self.processor, config['func'])
-            processing_job = method(signed_url, *params)
+            processing_job = config['bound'](signed_url)
             
             print('✅ Processing job created!')
             print(f'🆔 Job ID: {processing_job["id"]}')
@@ -197,11 +283,10 @@ class InteractiveAudioProcessor:
             print('\n⏳ Waiting for processing to complete...')
             print('This may take a few minutes depending on the file size...\n')
             
-            result = self.processor.wait_for_completion(processing_job['id'], 5000, 300000)
+            result = self.processor.wait_for_completion(processing_job['id'], max_wait_time=300000)
             
             # Download the processed file
             print('📥 Downloading processed audio file...')
-            download_url = result['result']['download_url']
             
             # Determine output file extension based on input file
             input_ext = Path(filename).suffix.lower()
@@ -209,39 +294,60 @@ class InteractiveAudioProcessor:
             
             output_path = f"{Path(filename).stem}-{command.replace(' ', '-')}{output_ext}"
             
-            if self.download_file(download_url, output_path):
-                print('\n✅ Processing completed successfully!')
-                print(f'📁 File saved as: {output_path}')
-                
-                # Check file size
-                file_size = os.path.getsize(output_path)
-                print(f'📊 File size: {self.format_file_size(file_size)}')
-                
-                if file_size > 0:
-                    print('🎉 The audio file is ready to play!')
-                else:
-                    print('⚠️ Warning: Downloaded file is empty')
-                
-                # Show statistics
-                if 'statistics' in result['result']:
-                    stats = result['result']['statistics']
-                    print('\n📊 Processing Statistics:')
-                    print(f'   Dead air removed: {stats.get("DEADAIR", 0)}')
-                    print(f'   Breaths removed: {stats.get("BREATH", 0)}')
-                    print(f'   Stutters removed: {stats.get("STUTTERING", 0)}')
-                    print(f'   Mouth sounds removed: {stats.get("MOUTH_SOUND", 0)}')
-                    print(f'   Filler sounds removed: {stats.get("FILLER_SOUND", 0)}')
-                
-                # Show transcription if available
-                if 'transcription' in result['result'] and 'paragraphs' in result['result']['transcription']:
-                    paragraphs = result['result']['transcription']['paragraphs']
-                    print('\n📝 Transcription:')
-                    for i, paragraph in enumerate(paragraphs[:3]):
-                        print(f'   {i + 1}. [{paragraph["start"]}s - {paragraph["end"]}s] {paragraph["text"]}')
-                    if len(paragraphs) > 3:
-                        print(f'   ... and {len(paragraphs) - 3} more paragraphs')
-                
-                print('\n🎵 Ready for next command! Type "help" for options or "quit" to exit.')
+            self.save_result(result, output_path)
+            
+        except Exception as e:
+            print(f'❌ Error processing audio: {e}')
+            print('\n💡 Make sure your API key is correct and you have internet connection')
+    
+    async def process_folder(self, command: str):
+        """Process every audio file in the current directory as a single batch job"""
+        try:
+            config = self.function_map.get(command)
+            if not config:
+                print('❌ Unknown command. Type "help" to see available commands.')
+                return
+            
+            print(f'\n🎵 {config["name"]} (all files)')
+            print('================\n')
+            
+            # Leave out results of earlier commands so reruns don't process them again
+            file_paths = [path for path in self.find_audio_files() if not self.is_generated_output(path)]
+            
+            if not file_paths:
+                print('❌ No supported audio file found in the current directory')
+                print('💡 Supported formats: MP3, WAV, M4A, FLAC, AAC')
+                return
+            
+            print(f'📁 Found {len(file_paths)} audio files')
+            print('📤 Uploading files to Cleanvoice servers...')
+            
+            # Upload all files in parallel
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                signed_urls = list(executor.map(
+                    lambda path: self.processor.upload_file(path, os.path.basename(path)),
+                    file_paths
+                ))
+            print('✅ Files uploaded successfully!')
+            
+            # Submit one job covering every file
+            print(f'\n🔧 Processing audio with {config["name"]}...')
+            processing_job = config['bound'](signed_urls)
+            
+            print('✅ Processing job created!')
+            print(f'🆔 Job ID: {processing_job["id"]}')
+            
+            print('\n⏳ Waiting for processing to complete...')
+            print('This may take a few minutes depending on the file sizes...\n')
+            
+            result = self.processor.wait_for_completion(processing_job['id'], max_wait_time=300000)
+            
+            # The API returns one combined file for a multi-file job
+            print('📥 Downloading combined audio file...')
+            output_ext = Path(file_paths[0]).suffix.lower()
+            output_path = f"batch-{command.replace(' ', '-')}{output_ext}"
+            
+            self.save_result(result, output_path)
             
         except Exception as e:
             print(f'❌ Error processing audio: {e}')
@@ -253,31 +359,38 @@ class InteractiveAudioProcessor:
         print('=====================================================')
         self.show_help()
         
-        while True:
-            try:
-                command = input('\n🎵 Enter command (or "help"): ').strip().lower()
-                
-                if command in ['quit', 'exit']:
-                    print('\n👋 Goodbye! Thanks for using the Audio Processor!')
+        # One loop to run the command coroutines, instead of a new one per command
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    command = input('\n🎵 Enter command (or "help"): ').strip().lower()
+                    
+                    if command in ['quit', 'exit']:
+                        print('\n👋 Goodbye! Thanks for using the Audio Processor!')
+                        break
+                    
+                    if command == 'help':
+                        self.show_help()
+                        continue
+                    
+                    if command == '':
+                        print('❌ Please enter a command. Type "help" for options.')
+                        continue
+                    
+                    if command.startswith('all '):
+                        loop.run_until_complete(self.process_folder(command[4:].strip()))
+                    else:
+                        loop.run_until_complete(self.process_audio_file(command))
+                    
+                except KeyboardInterrupt:
+                    print('\n\n👋 Goodbye! Thanks for using the Audio Processor!')
                     break
-                
-                if command == 'help':
-                    self.show_help()
-                    continue
-                
-                if command == '':
-                    print('❌ Please enter a command. Type "help" for options.')
-                    continue
-                
-                # Run the async function in sync context
-                import asyncio
-                asyncio.run(self.process_audio_file(command))
-                
-            except KeyboardInterrupt:
-                print('\n\n👋 Goodbye! Thanks for using the Audio Processor!')
-                break
-            except Exception as e:
-                print(f'❌ Unexpected error: {e}')
+                except Exception as e:
+                    print(f'❌ Unexpected error: {e}')
+        finally:
+            loop.run_until_complete(self.processor.aclose())
+            loop.close()
 
 
 def main():